@@ -5,23 +5,24 @@ Graphisches Programm zum sortieren von Bildern in verschiedene Ordner.
 
 from typing import List, Dict, Callable, Tuple, Optional
 
-import imghdr
-
 import tkinter as tk
 from tkinter import ttk, N, E, S, W
 import tkinter.filedialog as tkfd
 import tkinter.messagebox as tkmb
 
+import os
 import pathlib
 import shutil
 
-import copy
+import functools
+import concurrent.futures
 
 from dataclasses import dataclass
 
 import argparse
 import sys
 
+import PIL
 import PIL.Image
 import PIL.ImageTk
 
@@ -36,14 +37,106 @@ import PIL.ImageTk
 # https://web.archive.org/web/20201111190625/http://effbot.org/pyfaq/why-do-my-tkinter-images-not-appear.htm
 
 
-def get_images_in(directory: pathlib.Path) -> List[pathlib.Path]:
-    entities = directory.glob("*")
-    files = [x for x in entities if x.is_file()]
-    images = [x for x in files if imghdr.what(x) is not None]
+# Filter used to scale down the images for display.
+# ``PIL.Image.ANTIALIAS`` was removed in Pillow 10; older versions have no
+# ``PIL.Image.Resampling``.
+# On slow machines, ``BILINEAR`` or ``BICUBIC`` are faster alternatives.
+RESAMPLE_FILTER = getattr(PIL.Image, "Resampling", PIL.Image).LANCZOS
+
+# Before resampling with RESAMPLE_FILTER, the images are scaled down cheaply
+# -- by the JPEG decoder while loading and by integer factors (box averaging)
+# afterwards -- as long as they stay at least this many times larger than the
+# requested size.
+# Larger values give better quality, smaller ones are faster.
+THUMBNAIL_REDUCING_GAP = 2.0
+
+
+# suffixes of all files Pillow can open; some formats can only be saved and
+# EPS needs Ghostscript
+IMAGE_SUFFIXES = frozenset(
+    suffix
+    for suffix, image_format in PIL.Image.registered_extensions().items()
+    if image_format in PIL.Image.OPEN and image_format != "EPS"
+)
+
+# first bytes of image files
+IMAGE_MAGIC_PREFIXES = (
+    b"\xff\xd8\xff",  # jpeg
+    b"\x89PNG",  # png
+    b"GIF8",  # gif
+    b"BM",  # bmp
+    b"II*\x00",  # tiff, little endian
+    b"MM\x00*",  # tiff, big endian
+)
+
+
+def has_image_header(file: str) -> bool:
+    """
+    Check, whether the file starts like an image file.
+    """
+    with open(file, "rb") as f:
+        header = f.read(12)
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return True
+    return header.startswith(IMAGE_MAGIC_PREFIXES)
+
+
+def is_image(file: str) -> bool:
+    """
+    Check, whether the file is an image -- by its suffix or, if that is not
+    known, by its content.
+    """
+    _, suffix = os.path.splitext(file)
+    if suffix.lower() in IMAGE_SUFFIXES:
+        return True
+    return has_image_header(file)
+
+
+def get_images_in(directory: pathlib.Path) -> List[str]:
+    """
+    Return the paths of the images in the directory.
+    Paths are returned as strings as there may be a lot of them; create a
+    ``pathlib.Path`` only when using one.
+    """
+    # entries of scandir know whether they are a file without an additional
+    # stat (except for symlinks)
+    with os.scandir(directory) as entries:
+        files = [x.path for x in entries if x.is_file()]
+    images = [x for x in files if is_image(x)]
     sorted_images = sorted(images)
     return sorted_images
 
 
+# Number of scaled-down images to keep in memory.
+THUMBNAIL_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=THUMBNAIL_CACHE_SIZE)
+def _load_thumbnail(path: str, size: int, mtime_ns: int) -> PIL.Image.Image:
+    """
+    Load the image at ``path`` scaled down to fit into ``size`` x ``size``.
+
+    ``mtime_ns`` is not used but part of the cache key, so that files changed
+    on disk are loaded again.
+    """
+    content = PIL.Image.open(path)
+    # thumbnail lets the decoder (libjpeg) scale down while loading, too
+    content.thumbnail((size, size), RESAMPLE_FILTER, reducing_gap=THUMBNAIL_REDUCING_GAP)
+    return content
+
+
+def _load_current_thumbnail(file: str, size: int) -> PIL.Image.Image:
+    """
+    Load the thumbnail of ``file`` in its current version (using the cache of
+    ``_load_thumbnail``).
+    Meant to run in a worker thread, so errors (e.g. if the file was removed)
+    end up in the future.
+    """
+    # normalize to get the same cache key for all ways to denote the file
+    path = str(pathlib.Path(file))
+    return _load_thumbnail(path, size, os.stat(path).st_mtime_ns)
+
+
 def get_expected_file_in_directory(file: pathlib.Path, directory: pathlib.Path) -> pathlib.Path:
     """
     Return the expected file in the directory -- the file may exist or not.
@@ -52,14 +145,50 @@ def get_expected_file_in_directory(file: pathlib.Path, directory: pathlib.Path)
     return expected_file
 
 
+class DirectoryContents:
+    """
+    Names of the files in a directory, read once and then kept up to date by
+    the functions in this module that copy/delete files.
+
+    Use ``DirectoryContents.get`` to obtain the (cached) contents of a directory.
+    """
+
+    _cache: Dict[pathlib.Path, "DirectoryContents"] = {}
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        if not directory.is_dir():
+            raise ValueError(f"{directory} is not a directory.")
+        with os.scandir(directory) as entries:
+            self._names = {x.name for x in entries if x.is_file()}
+
+    @classmethod
+    def get(cls, directory: pathlib.Path) -> "DirectoryContents":
+        if directory not in cls._cache:
+            cls._cache[directory] = DirectoryContents(directory)
+        return cls._cache[directory]
+
+    @classmethod
+    def forget(cls, directory: pathlib.Path) -> None:
+        """
+        Drop the cached contents, e.g. if the directory was changed by someone else.
+        """
+        cls._cache.pop(directory, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def add(self, name: str) -> None:
+        self._names.add(name)
+
+    def remove(self, name: str) -> None:
+        self._names.discard(name)
+
+
 def is_file_in_directory(file: pathlib.Path, directory: pathlib.Path) -> bool:
     """
     Check, whether a file with the same filename exists in the given directory.
     """
-    if not directory.is_dir():
-        raise ValueError(f"{directory} is not a directory.")
-    expected_file = get_expected_file_in_directory(file, directory)
-    return expected_file.exists() and expected_file.is_file()
+    return file.name in DirectoryContents.get(directory)
 
 
 def copy_file_to_directory(file: pathlib.Path, directory: pathlib.Path) -> None:
@@ -70,7 +199,10 @@ def copy_file_to_directory(file: pathlib.Path, directory: pathlib.Path) -> None:
         print(f"File {file} already in {directory}")
         return
     print(f"Copy {file} to {directory}", end="... ")
-    shutil.copy(file, directory)
+    # copyfile copies in kernel space (sendfile) where available and, unlike
+    # copy, does not copy the permission bits as well
+    shutil.copyfile(file, get_expected_file_in_directory(file, directory))
+    DirectoryContents.get(directory).add(file.name)
     print("done")
 
 
@@ -86,6 +218,7 @@ def delete_file_in_directory(file: pathlib.Path, directory: pathlib.Path) -> Non
         raise ValueError(f"File {file} in {directory} (i.e. {expected_file} is not a file.")
     print(f"Delete {file} in {directory}, i.e. {expected_file}", end="... ")
     expected_file.unlink()
+    DirectoryContents.get(directory).remove(file.name)
     print("done")
 
 
@@ -95,9 +228,10 @@ class FileAction:
 
     Note: The ``action`` to perform is not copied.
 
-    Use this in a callback to make sure that the file/destination is "immutable"
-    -- i.e. that they are not changed if the variables used to denote
-    file/destination get a new value.
+    Use this in a callback to make sure that the file/destination is not
+    changed if the variables used to denote file/destination get a new value.
+    Note that ``source`` is reassigned on purpose when a ``SelectableImage``
+    is reused for another file (see ``SelectableImage.retarget``).
     """
 
     def __init__(
@@ -106,8 +240,9 @@ class FileAction:
         directory: pathlib.Path,
         action: Callable[[pathlib.Path, pathlib.Path], None],
     ) -> None:
-        self.source = copy.deepcopy(file)
-        self.destination = copy.deepcopy(directory)
+        # paths are immutable, so no need to copy them
+        self.source = file
+        self.destination = directory
         self.action = action
         self.callbacks: List[Callable[[], None]] = []
 
@@ -122,6 +257,28 @@ def set_button_active(button: ttk.Button, should_be_active: bool) -> None:
     button.state([command])
 
 
+@dataclass(frozen=True)
+class DestinationTexts:
+    """
+    The texts to display for a destination directory.
+    They only depend on the directory, so create them once per directory.
+    """
+
+    copy_button: str
+    delete_button: str
+    is_copied: str
+    is_not_copied: str
+
+    @staticmethod
+    def for_directory(directory: pathlib.Path) -> "DestinationTexts":
+        return DestinationTexts(
+            copy_button=f"Kopiere nach {directory.name}",
+            delete_button=f"Loesche in {directory.name}",
+            is_copied=f"schon in {directory.name}",
+            is_not_copied=f"noch nicht in {directory.name}",
+        )
+
+
 @dataclass
 class FileCopyUI:
     """
@@ -130,18 +287,24 @@ class FileCopyUI:
 
     file: pathlib.Path
     destination_directory: pathlib.Path
+    texts: DestinationTexts
     current_state: ttk.Label
     copy_button: ttk.Button
     delete_button: ttk.Button
+    # state currently displayed, None if nothing is displayed yet
+    displayed_is_copied: Optional[bool] = None
 
     def update(self) -> None:
         """
         Update state of UI according to files found on disk.
         """
         is_copied = is_file_in_directory(self.file, self.destination_directory)
-        text_prefix = "schon" if is_copied else "noch nicht"
+        # changing the UI elements is expensive, so only do it if necessary
+        if is_copied == self.displayed_is_copied:
+            return
+        self.displayed_is_copied = is_copied
 
-        self.current_state["text"] = f"{text_prefix} in {self.destination_directory.name}"
+        self.current_state["text"] = self.texts.is_copied if is_copied else self.texts.is_not_copied
         self.current_state["background"] = "green" if is_copied else "blue"
         self.current_state["foreground"] = "black" if is_copied else "white"
 
@@ -149,6 +312,10 @@ class FileCopyUI:
         set_button_active(self.delete_button, is_copied)
 
 
+# Time between checks whether an image loaded in the background is available.
+LOADING_POLL_INTERVAL_MS = 20
+
+
 class SelectableImage(ttk.Frame):
     """
     UI elements to display a single image and the information in what
@@ -158,70 +325,133 @@ class SelectableImage(ttk.Frame):
     def draw(self):
         """
         Update the image to display.
-        Currently the logic for file actions will fail if we change the name as
-        the FileActions still have the old name set.
         """
         # image
-        content = PIL.Image.open(self.file)
-        content.thumbnail(self.size, PIL.Image.ANTIALIAS)
-        photo = PIL.ImageTk.PhotoImage(content)
-        self.image["image"] = photo
-        self.image.image = photo  # type: ignore  See tkinter-lifetime above
+        self.loading = self.load_image(self.file, self.size[0])
+        if self.loading.done():
+            # loaded before -- show it right away to avoid flickering
+            self.show_image(self.loading)
+        else:
+            # loaded in the background; until then do not show the previous
+            # image next to the controls for the new file
+            self.clear_image()
+            self.wait_for_image(self.loading)
         # label
         self.label["text"] = self.file.name
         # controls
         for ui in self.file_uis.values():
             ui.update()
 
+    def clear_image(self) -> None:
+        self.image["image"] = ""
+        self.image.image = None  # type: ignore  See tkinter-lifetime above
+        self.image["text"] = ""
+
+    def wait_for_image(self, loading: "concurrent.futures.Future[PIL.Image.Image]") -> None:
+        """
+        Check regularly whether ``loading`` is done and then show the image.
+
+        The worker threads must not touch the UI (not even with ``after``), so
+        the UI thread polls instead of being notified.
+        """
+        if loading is not self.loading:
+            # another file or size was requested in the meantime
+            return
+        if loading.done():
+            self.show_image(loading)
+        else:
+            self.after(LOADING_POLL_INTERVAL_MS, self.wait_for_image, loading)
+
+    def show_image(self, loaded: "concurrent.futures.Future[PIL.Image.Image]") -> None:
+        """
+        Display the loaded image.
+        """
+        if loaded.exception() is not None:
+            print(f"Cannot load {self.file}: {loaded.exception()}")
+            self.image["text"] = "kann nicht geladen werden"
+            return
+        photo = PIL.ImageTk.PhotoImage(loaded.result())
+        self.image["text"] = ""
+        self.image["image"] = photo
+        self.image.image = photo  # type: ignore  See tkinter-lifetime above
+
+    def hide(self) -> None:
+        """
+        Remove from display; stop loading and release the image until retargeted.
+        """
+        self.grid_forget()
+        if self.loading is not None:
+            self.loading.cancel()
+            self.loading = None
+        self.clear_image()
+
+    def retarget(self, file: str, size: Tuple[int, int]) -> None:
+        """
+        Display another file (at another size) reusing the existing UI elements.
+        """
+        if self.loading is not None:
+            # the previous image is not needed anymore
+            self.loading.cancel()
+        self.file = pathlib.Path(file)
+        self.size = size
+        for action in self.file_actions:
+            action.source = self.file
+        for ui in self.file_uis.values():
+            ui.file = self.file
+        self.draw()
+
     def __init__(
         self,
         parent: ttk.Frame,
-        file: pathlib.Path,
+        file: str,
         destination_directories: List[pathlib.Path],
+        destination_texts: List[DestinationTexts],
+        load_image: Callable[[pathlib.Path, int], "concurrent.futures.Future[PIL.Image.Image]"],
         size: Tuple[int, int] = (300, 300),
     ):
         super().__init__(parent)
 
-        self.file = file
+        self.file = pathlib.Path(file)
         self.size = size
+        self.load_image = load_image
+        self.loading: Optional["concurrent.futures.Future[PIL.Image.Image]"] = None
 
         self.image = ttk.Label(self)
         self.image.grid(column=0, row=0)
 
-        self.label = ttk.Label(self, text=file.name)
+        self.label = ttk.Label(self, text=self.file.name)
         self.label.grid(column=0, row=1)
 
         destinations = ttk.Frame(self)
 
-        self.file_uis: Dict[str, FileCopyUI] = {}
+        self.destinations = destination_directories
+        # key is the index in destination_directories
+        self.file_uis: Dict[int, FileCopyUI] = {}
+        self.file_actions: List[FileAction] = []
 
-        for index, possible_destination in enumerate(destination_directories):
-            is_copied = is_file_in_directory(file, possible_destination)
-            text_prefix = "schon" if is_copied else "noch nicht"
-            state = ttk.Label(
-                destinations,
-                text=f"{text_prefix} in {possible_destination.name}",
-                background="green" if is_copied else "blue",
-            )
+        for index, (possible_destination, texts) in enumerate(zip(destination_directories, destination_texts)):
+            # text and color are set in draw
+            state = ttk.Label(destinations)
             state.grid(row=0, column=index)
-            copyer = FileAction(file, possible_destination, copy_file_to_directory)
+            copyer = FileAction(self.file, possible_destination, copy_file_to_directory)
             copy_button = ttk.Button(
                 destinations,
-                text=f"Kopiere nach {possible_destination.name}",
+                text=texts.copy_button,
                 command=copyer,
             )
             copy_button.grid(row=1, column=index)
-            deleter = FileAction(file, possible_destination, delete_file_in_directory)
+            deleter = FileAction(self.file, possible_destination, delete_file_in_directory)
             delete_button = ttk.Button(
                 destinations,
-                text=f"Loesche in {possible_destination.name}",
+                text=texts.delete_button,
                 command=deleter,
             )
             delete_button.grid(row=2, column=index)
 
             ui = FileCopyUI(
-                file=file,
+                file=self.file,
                 destination_directory=possible_destination,
+                texts=texts,
                 current_state=state,
                 copy_button=copy_button,
                 delete_button=delete_button,
@@ -229,8 +459,9 @@ class SelectableImage(ttk.Frame):
 
             for action in [copyer, deleter]:
                 action.callbacks.append(ui.update)
+                self.file_actions.append(action)
 
-            self.file_uis[possible_destination] = ui
+            self.file_uis[index] = ui
 
         destinations.grid(column=0, row=2)
 
@@ -243,8 +474,18 @@ class CurrentImagesProvider:
     """
 
     def __init__(self, source_directory: pathlib.Path) -> None:
+        # thumbnails of a previous source directory are of no use anymore
+        _load_thumbnail.cache_clear()
         self.images = get_images_in(source_directory)
         self.current = 0
+        # Pillow releases the GIL while decoding, so threads do run in parallel.
+        # Prefetching has its own thread, so that images to display right now
+        # do not wait for it.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._prefetching: List[concurrent.futures.Future] = []
+        # all loaded/loading thumbnails, see _thumbnail_key; oldest first
+        self._thumbnails: Dict[Tuple[str, int, int], "concurrent.futures.Future[PIL.Image.Image]"] = {}
 
     def skim(self, number_of_images: int):
         """
@@ -253,7 +494,7 @@ class CurrentImagesProvider:
         """
         self.current = max(0, min(self.current + number_of_images, len(self.images) - 1))
 
-    def get(self, number_of_images: int) -> List[pathlib.Path]:
+    def get(self, number_of_images: int) -> List[str]:
         """
         Return paths to ``number_of_images`` images (or less, if only less are available).
         """
@@ -269,6 +510,84 @@ class CurrentImagesProvider:
         images = self.images[index : index + number_of_images]
         return images
 
+    @staticmethod
+    def _thumbnail_key(file: str, size: int) -> Optional[Tuple[str, int, int]]:
+        """
+        Return the key of the thumbnail of the current version of ``file`` or
+        None if the file cannot be accessed.
+        """
+        path = str(pathlib.Path(file))
+        try:
+            return (path, size, os.stat(path).st_mtime_ns)
+        except OSError:
+            # loading will fail as well and report the error
+            return None
+
+    def _get_loaded_thumbnail(
+        self, key: Optional[Tuple[str, int, int]]
+    ) -> Optional["concurrent.futures.Future[PIL.Image.Image]"]:
+        """
+        Return the successfully loaded thumbnail for ``key`` or None.
+        """
+        if key is None or key not in self._thumbnails:
+            return None
+        loaded = self._thumbnails[key]
+        if not loaded.done() or loaded.cancelled() or loaded.exception() is not None:
+            return None
+        return loaded
+
+    def _load_in(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        file: str,
+        size: int,
+    ) -> "concurrent.futures.Future[PIL.Image.Image]":
+        """
+        Return the thumbnail of ``file`` -- if it is not loaded yet, start
+        loading it with ``executor``.
+        """
+        key = self._thumbnail_key(file, size)
+        loaded = self._get_loaded_thumbnail(key)
+        if loaded is not None:
+            return loaded
+        loading = executor.submit(_load_current_thumbnail, file, size)
+        if key is not None:
+            self._thumbnails[key] = loading
+            while len(self._thumbnails) > THUMBNAIL_CACHE_SIZE:
+                del self._thumbnails[next(iter(self._thumbnails))]
+        return loading
+
+    def load(self, file: pathlib.Path, size: int) -> "concurrent.futures.Future[PIL.Image.Image]":
+        """
+        Load the image ``file`` scaled down to ``size`` in the background.
+        The returned future is already done if the image was loaded before.
+        """
+        return self._load_in(self._executor, str(file), size)
+
+    def shutdown(self) -> None:
+        """
+        Stop loading images in the background.
+        """
+        self._executor.shutdown(cancel_futures=True)
+        self._prefetch_executor.shutdown(cancel_futures=True)
+
+    def prefetch(self, number_of_images: int, size: int) -> None:
+        """
+        Load the images next to the ``number_of_images`` current ones in the
+        background, so that they are available when skimming.
+        """
+        for future in self._prefetching:
+            future.cancel()
+        number_of_images = min(number_of_images, len(self.images))
+        first = min(self.current, len(self.images) - number_of_images)
+        last = first + number_of_images - 1
+        neighbours = [last + 1, last + 2, first - 1]
+        self._prefetching = [
+            self._load_in(self._prefetch_executor, self.images[index], size)
+            for index in neighbours
+            if 0 <= index < len(self.images)
+        ]
+
     def progress(self) -> float:
         """
         Return progress in percent.
@@ -276,6 +595,10 @@ class CurrentImagesProvider:
         return (100 * (self.current + 1)) / len(self.images)
 
 
+# Time to wait for further input before displaying changed number/size of images.
+REFRESH_DELAY_MS = 200
+
+
 class PhotoSelectionGUI:
     """
     UI to display controls and images to copy.
@@ -320,7 +643,6 @@ class PhotoSelectionGUI:
             width=5,
         )
         num_images_spinbox.grid(row=11, column=0)
-        num_images_spinbox.value = num_images  # type: ignore  See tkinter-lifetime above
         ttk.Label(actions_frame, text="Groesse:").grid(row=20, column=0)
         size_images = tk.IntVar(root, value=500)
         size_images_spinbox = ttk.Spinbox(
@@ -332,7 +654,6 @@ class PhotoSelectionGUI:
             width=5,
         )
         size_images_spinbox.grid(row=21, column=0)
-        size_images_spinbox.value = size_images  # type: ignore  See tkinter-lifetime above
         ttk.Label(actions_frame, text="Fortschritt:").grid(row=30, column=0)
         progress = tk.DoubleVar(root, value=0)
         progress_bar = ttk.Progressbar(
@@ -340,7 +661,6 @@ class PhotoSelectionGUI:
             variable=progress,
             orient=tk.HORIZONTAL,
         )
-        progress_bar.value = progress  # type: ignore  See tkinter-lifetime above
         progress_bar.grid(row=31, column=0)
         actions_frame.grid(row=0, column=0, sticky=N)
         # END frame
@@ -349,12 +669,31 @@ class PhotoSelectionGUI:
         self.progress = progress
 
         # callback to react on numeric UI input
-        self.num_images.trace_add("write", lambda _, __, ___: self.display_current_images())
-        self.size_images.trace_add("write", lambda _, __, ___: self.display_current_images())
+        self.root = root
+        self._pending_after: Optional[str] = None
+        self.num_images.trace_add("write", lambda _, __, ___: self._schedule_refresh())
+        self.size_images.trace_add("write", lambda _, __, ___: self._schedule_refresh())
 
         self.destination_directories = destination_directories
+        self.destination_texts = [DestinationTexts.for_directory(x) for x in destination_directories]
         self.images = ttk.Frame(mainframe)
         self.images.grid(row=0, column=1)
+        # creating the UI elements is expensive, so they are reused
+        self._widget_pool: List[SelectableImage] = []
+
+    def _schedule_refresh(self) -> None:
+        """
+        Display the current images soon -- when the input changes quickly
+        (e.g. while typing or holding the spinbox arrows), only the last
+        change is displayed.
+        """
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+        self._pending_after = self.root.after(REFRESH_DELAY_MS, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._pending_after = None
+        self.display_current_images()
 
     def next_image(self) -> None:
         self.images_provider.skim(+1)
@@ -369,16 +708,32 @@ class PhotoSelectionGUI:
         images = self.images_provider.get(number_of_images)
         self.display_images(images)
         self.progress.set(self.images_provider.progress())
+        self.images_provider.prefetch(number_of_images, self.size_images.get())
 
-    def display_images(self, image_files: List[pathlib.Path]) -> None:
-        # remove the old ones
-        for image in self.images.grid_slaves():
-            image.destroy()
-        # set the new ones
+    def display_images(self, image_files: List[str]) -> None:
         size = self.size_images.get()
+        # read every destination once to notice changes made by other programs
+        for destination in self.destination_directories:
+            DirectoryContents.forget(destination)
+        # set the new ones
         for index, image_file in enumerate(image_files):
-            image = SelectableImage(self.images, image_file, self.destination_directories, (size, size))
+            if index < len(self._widget_pool):
+                image = self._widget_pool[index]
+                image.retarget(image_file, (size, size))
+            else:
+                image = SelectableImage(
+                    self.images,
+                    image_file,
+                    self.destination_directories,
+                    self.destination_texts,
+                    self.images_provider.load,
+                    (size, size),
+                )
+                self._widget_pool.append(image)
             image.grid(row=0, column=index)
+        # hide the remaining old ones
+        for image in self._widget_pool[len(image_files) :]:
+            image.hide()
 
 
 @dataclass
@@ -418,7 +773,7 @@ def ask_for_missing_options(arguments: CommandLineArguments, root: tk.Tk) -> Pro
     """
     Complete the missing information by askin the user interactively.
     """
-    values = copy.deepcopy(arguments)
+    values = CommandLineArguments(arguments.source_directory, list(arguments.target_directories))
     if values.source_directory is None:
         values.source_directory = insist_for_directory(
             "Ordner mit allen Bildern auswaehlen.",
@@ -476,6 +831,8 @@ def parse_arguments(argv=sys.argv[1:]) -> CommandLineArguments:
 
 def main():
     arguments = parse_arguments()
+    # Pillow-SIMD reports versions like 9.0.0.post1
+    print(f"Using Pillow {PIL.__version__}")
 
     root = tk.Tk()
     options = ask_for_missing_options(arguments, root)
@@ -488,6 +845,7 @@ def main():
     app.display_current_images()
 
     root.mainloop()
+    app.images_provider.shutdown()
 
 
 if __name__ == "__main__":